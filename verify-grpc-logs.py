@@ -6,91 +6,269 @@ identified in grpc-enhancements-plan.md.
 This searches for "handled request for <function_name>" logs in env:prod
 and checks if the response bodies contain the expected location/address data.
 
-Uses only standard library - no external dependencies required.
+Uses only standard library - no external dependencies required. If ijson is
+installed, search responses are stream-parsed instead of buffered; if orjson
+is installed, it is used to encode and decode DataDog payloads.
 """
 
+# Modules only needed for searching (ssl, http.client, gzip, orjson, ...)
+# are imported inside the functions that use them, so exiting on missing
+# credentials or --help does not pay for their initialization.
+from __future__ import annotations
+
 import os
+import argparse
+import contextlib
+import functools
+import importlib
+import io
 import json
-import urllib.request
-import urllib.error
-import ssl
-from datetime import datetime, timedelta
+import re
+import sys
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    import http.client
+    import ssl
+
+
+@functools.lru_cache(maxsize=None)
+def optional_module(name: str):
+    """
+    Import an optional accelerator module (ijson, orjson) on first use.
+    Returns None if it is not installed.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _dumps(obj) -> bytes:
+    """
+    Encode a DataDog payload as JSON UTF-8 bytes, using orjson when
+    installed. Sample output is still pretty-printed with the stdlib json
+    module.
+    """
+    orjson = optional_module("orjson")
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Decode a DataDog JSON payload from UTF-8 bytes, using orjson when installed."""
+    orjson = optional_module("orjson")
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# KEY=value lines; whitespace around both is ignored. Comments and blank
+# lines never match. [^\S\n] is whitespace other than a newline, so an empty
+# value cannot run on into the next line.
+ENV_LINE_PATTERN = re.compile(r"(?m)^[^\S\n]*([A-Z_][A-Z0-9_]*)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$")
 
 
 def load_env():
     """Load environment variables from .env file."""
+    # The environment takes precedence, so there is nothing to read if both
+    # credentials are already exported with non-empty values
+    if os.environ.get("DD_API_KEY") and os.environ.get("DD_APP_KEY"):
+        return {}
+
     env_path = Path(__file__).parent / ".env"
-    env_vars = {}
+    if not env_path.exists():
+        return {}
+
+    return dict(ENV_LINE_PATTERN.findall(env_path.read_text()))
 
-    if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip()
 
-    return env_vars
+def load_credentials() -> tuple:
+    """
+    Return (DD_API_KEY, DD_APP_KEY), exiting if either is missing.
+    A key exported in the environment takes precedence over the .env file.
+    """
+    env_vars = load_env()
+    api_key = os.getenv('DD_API_KEY') or env_vars.get('DD_API_KEY')
+    app_key = os.getenv('DD_APP_KEY') or env_vars.get('DD_APP_KEY')
+
+    if not api_key or not app_key:
+        print("ERROR: DD_API_KEY and DD_APP_KEY must be set in the environment or .env file")
+        exit(1)
 
+    return api_key, app_key
+
+
+DD_API_HOST = "api.datadoghq.com"
+DD_SEARCH_PATH = "/api/v2/logs/events/search"
+
+# Identical for every search request; the credentials are added by
+# build_search_headers once they have been loaded
+BASE_SEARCH_HEADERS = {
+    "Content-Type": "application/json",
+    "Content-Encoding": "gzip",
+    "Accept-Encoding": "gzip"
+}
+
+
+def build_search_headers(api_key: str, app_key: str) -> dict:
+    """Return the headers sent with every search request, built once per run."""
+    return {
+        **BASE_SEARCH_HEADERS,
+        "DD-API-KEY": api_key,
+        "DD-APPLICATION-KEY": app_key
+    }
 
-# Load environment variables
-env_vars = load_env()
-DD_API_KEY = env_vars.get('DD_API_KEY') or os.getenv('DD_API_KEY')
-DD_APP_KEY = env_vars.get('DD_APP_KEY') or os.getenv('DD_APP_KEY')
+# Created once, by get_ssl_context, and shared by every connection
+_ssl_context = None
+_ssl_context_lock = threading.Lock()
 
-if not DD_API_KEY or not DD_APP_KEY:
-    print("ERROR: DD_API_KEY and DD_APP_KEY must be set in .env file")
-    exit(1)
+# Idle keep-alive connections shared by all search workers. A connection is
+# only ever used by one thread at a time: it is taken out of the pool for a
+# request and put back once the response has been read.
+_idle_connections = []
+_pool_lock = threading.Lock()
+
+# Successful search responses are cached on disk between runs; disabled
+# with --no-cache
+CACHE_DIR = Path("~/.cache/verify-grpc-logs").expanduser()
+cache_enabled = True
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+class ApiSpec(NamedTuple):
+    """A gRPC API function to verify and the fields its logs should contain."""
+    name: str
+    expected_fields: tuple[str, ...]
+    # expected_fields lowercased once, since field matching is case-insensitive
+    expected_fields_lc: tuple[str, ...]
+    description: str
+
+
+def api_spec(name: str, expected_fields: tuple[str, ...], description: str) -> ApiSpec:
+    """Build an ApiSpec, deriving the lowercased expected fields."""
+    return ApiSpec(
+        name,
+        expected_fields,
+        tuple(f.lower() for f in expected_fields),
+        description
+    )
 
-DD_API_URL = "https://api.datadoghq.com/api/v2/logs/events/search"
 
 # API functions to verify from grpc-enhancements-plan.md
 API_FUNCTIONS = [
-    {
-        "name": "GetDeliveryOrder",
-        "expected_fields": ["coordinates", "address", "latitude", "longitude"],
-        "description": "Single order lookup with address/coordinates"
-    },
-    {
-        "name": "GetTripDetails",
-        "expected_fields": ["orders", "coordinates", "address", "tripID"],
-        "description": "All orders in a trip with addresses"
-    },
-    {
-        "name": "GetRouteDetailsForTrip",
-        "expected_fields": ["routeSegments", "planned", "actual"],
-        "description": "Route waypoints (planned vs actual)"
-    },
-    {
-        "name": "GetLocationsDetails",
-        "expected_fields": ["locations", "locationNumber", "coordinates", "address"],
-        "description": "Restaurant address/coordinates by location_number"
-    },
-    {
-        "name": "GetDeliveryDriverByID",
-        "expected_fields": ["driver", "coordinates", "driverStatus"],
-        "description": "Driver current GPS location"
-    }
+    api_spec(
+        "GetDeliveryOrder",
+        ("coordinates", "address", "latitude", "longitude"),
+        "Single order lookup with address/coordinates"
+    ),
+    api_spec(
+        "GetTripDetails",
+        ("orders", "coordinates", "address", "tripID"),
+        "All orders in a trip with addresses"
+    ),
+    api_spec(
+        "GetRouteDetailsForTrip",
+        ("routeSegments", "planned", "actual"),
+        "Route waypoints (planned vs actual)"
+    ),
+    api_spec(
+        "GetLocationsDetails",
+        ("locations", "locationNumber", "coordinates", "address"),
+        "Restaurant address/coordinates by location_number"
+    ),
+    api_spec(
+        "GetDeliveryDriverByID",
+        ("driver", "coordinates", "driverStatus"),
+        "Driver current GPS location"
+    )
 ]
 
 
-def search_logs(function_name: str, limit: int = 5) -> dict:
+def get_ssl_context() -> ssl.SSLContext:
     """
-    Search DataDog for logs matching "handled request for <function_name>"
-    in env:prod.
+    Return the SSL context shared by every DataDog connection. It is created
+    (and the system CA bundle parsed) exactly once per run, on first use.
     """
-    # Search last 7 days
-    now = datetime.utcnow()
-    from_time = now - timedelta(days=7)
+    import ssl
+
+    global _ssl_context
+    with _ssl_context_lock:
+        if _ssl_context is None:
+            _ssl_context = ssl.create_default_context()
+        return _ssl_context
+
+
+def acquire_connection() -> http.client.HTTPSConnection:
+    """
+    Take an idle keep-alive connection to DataDog from the pool, or open a
+    new one if none is free.
+    """
+    import http.client
+
+    with _pool_lock:
+        if _idle_connections:
+            return _idle_connections.pop()
+    return http.client.HTTPSConnection(DD_API_HOST, context=get_ssl_context(), timeout=30)
+
+
+def release_connection(conn: http.client.HTTPSConnection) -> None:
+    """Return a connection whose response has been fully read to the pool."""
+    with _pool_lock:
+        _idle_connections.append(conn)
+
+
+def send_request(conn: http.client.HTTPSConnection, headers: dict,
+                 data: bytes) -> http.client.HTTPResponse:
+    """
+    POST a search body on conn. If the server has already closed the idle
+    keep-alive socket, reconnect and retry once.
+    """
+    import http.client
+
+    try:
+        conn.request("POST", DD_SEARCH_PATH, body=data, headers=headers)
+        return conn.getresponse()
+    except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+        # close() resets the connection so the next request reopens it
+        conn.close()
+        conn.request("POST", DD_SEARCH_PATH, body=data, headers=headers)
+        return conn.getresponse()
 
-    query = f'env:prod "handled request for {function_name}"'
+
+def post_search(query: str, headers: dict, from_str: str, to_str: str,
+                limit: int) -> dict:
+    """
+    POST a logs search to DataDog for the from_str..to_str window and return
+    the decoded response.
+    Searches run on worker threads, so failures are not printed here: they
+    come back as empty "data" plus an "errors" list of lines for the caller
+    to report.
+    """
+    import gzip
+    import hashlib
+    import http.client
+    import zlib
+
+    # Bucket the window start to the hour ("YYYY-MM-DDTHH") so repeated runs
+    # share a cache key
+    from_bucket = from_str[:13]
+    cache_key = hashlib.sha1(f"{query}|{from_bucket}|{limit}".encode('utf-8')).hexdigest()
+    cache_path = CACHE_DIR / f"{cache_key}.json"
+    if cache_enabled:
+        cached = read_cache(cache_path)
+        if cached is not None:
+            return cached
 
     body = {
         "filter": {
             "query": query,
-            "from": from_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "to": now.strftime("%Y-%m-%dT%H:%M:%SZ")
+            "from": from_str,
+            "to": to_str
         },
         "sort": "-timestamp",
         "page": {
@@ -98,130 +276,374 @@ def search_logs(function_name: str, limit: int = 5) -> dict:
         }
     }
 
-    headers = {
-        "DD-API-KEY": DD_API_KEY,
-        "DD-APPLICATION-KEY": DD_APP_KEY,
-        "Content-Type": "application/json"
-    }
+    data = gzip.compress(_dumps(body))
+    conn = acquire_connection()
 
-    data = json.dumps(body).encode('utf-8')
-    req = urllib.request.Request(DD_API_URL, data=data, headers=headers, method='POST')
+    try:
+        response = send_request(conn, headers, data)
+        if response.status >= 400:
+            # Only decode the part that is shown; a multi-byte character cut
+            # at the boundary is replaced rather than raising
+            error_body = read_body(response)[:500].decode('utf-8', errors='replace')
+            release_connection(conn)
+            return {
+                "data": [],
+                "errors": [
+                    f"ERROR: HTTP {response.status} searching {query}",
+                    f"Response: {error_body}"
+                ]
+            }
+        result = {"data": read_log_entries(response)}
+    except (OSError, http.client.HTTPException, EOFError, zlib.error) as e:
+        # Network failure or a truncated/corrupt gzip body. Drop the
+        # connection instead of returning it to the pool
+        conn.close()
+        return {"data": [], "errors": [f"ERROR: {e} searching {query}"]}
+
+    release_connection(conn)
+
+    if cache_enabled:
+        write_cache(cache_path, result)
+
+    return result
+
+
+def read_cache(cache_path: Path):
+    """
+    Return the cached response stored at cache_path, or None if there is no
+    usable cache entry (missing, unreadable or not valid JSON).
+    """
+    try:
+        return _loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache(cache_path: Path, result: dict) -> None:
+    """
+    Store a response at cache_path. The file is written under a temporary
+    name and renamed into place, so an interrupted or concurrent run never
+    leaves a truncated entry behind. The cache is best-effort: failures to
+    write it are ignored.
+    """
+    import tempfile
 
-    # Create SSL context
-    ctx = ssl.create_default_context()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    except OSError:
+        return
 
     try:
-        with urllib.request.urlopen(req, context=ctx, timeout=30) as response:
-            return json.loads(response.read().decode('utf-8'))
-    except urllib.error.HTTPError as e:
-        print(f"  ERROR: HTTP {e.code}")
-        error_body = e.read().decode('utf-8')[:500] if e.fp else ""
-        print(f"  Response: {error_body}")
-        return {"data": []}
-    except urllib.error.URLError as e:
-        print(f"  ERROR: {e.reason}")
-        return {"data": []}
+        with os.fdopen(fd, "wb") as f:
+            f.write(_dumps(result))
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        pass
+    finally:
+        # Gone already if the rename succeeded
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+
+
+def read_body(response: http.client.HTTPResponse) -> bytes:
+    """
+    Read the full response body, decompressing it if gzipped.
+    """
+    import gzip
+
+    payload = response.read()
+    if response.getheader("Content-Encoding") == "gzip":
+        payload = gzip.decompress(payload)
+    return payload
+
+
+def read_log_entries(response: http.client.HTTPResponse) -> list:
+    """
+    Decode the "data" log entries from a search response, streaming them
+    with ijson when available instead of buffering the whole body.
+    """
+    import gzip
+
+    ijson = optional_module("ijson")
+    if ijson is None:
+        return _loads(read_body(response)).get("data", [])
+
+    stream = response
+    if response.getheader("Content-Encoding") == "gzip":
+        stream = gzip.GzipFile(fileobj=response)
+    entries = list(ijson.items(stream, "data.item", use_float=True))
+    # Always drain the body so the connection can be reused
+    response.read()
+    return entries
+
+
+def search_logs(function_name: str, headers: dict, from_str: str, to_str: str,
+                limit: int = 5) -> dict:
+    """
+    Search DataDog for logs matching "handled request for <function_name>"
+    in env:prod.
+    """
+    query = f'env:prod "handled request for {function_name}"'
+    return post_search(query, headers, from_str, to_str, limit)
 
 
-def check_fields_in_response(log_entry: dict, expected_fields: list) -> dict:
+def search_logs_batch(function_names: list, headers: dict, from_str: str, to_str: str,
+                      per_func_limit: int = 5) -> tuple[dict, list]:
     """
-    Check if expected fields exist anywhere in the log entry.
+    Search DataDog for all functions with a single OR query and split the
+    matching logs per function.
+    Returns a dict with function name -> list of log entries (at most
+    per_func_limit each), and the search's error lines (empty on success).
+    """
+    terms = " OR ".join(f'"handled request for {name}"' for name in function_names)
+    query = f"env:prod ({terms})"
+    response = post_search(
+        query, headers, from_str, to_str, len(function_names) * per_func_limit
+    )
+
+    # A single alternation finds the function in one pass over each message.
+    # Longest names go first so a name that prefixes another cannot shadow it
+    alternatives = "|".join(
+        re.escape(name) for name in sorted(function_names, key=len, reverse=True)
+    )
+    matcher = re.compile(f"handled request for ({alternatives})")
+
+    results_by_func = {name: [] for name in function_names}
+    for log_entry in response.get("data", []):
+        message = log_entry.get("attributes", {}).get("message") or ""
+        match = matcher.search(message)
+        if match is None:
+            continue
+        bucket = results_by_func[match.group(1)]
+        if len(bucket) < per_func_limit:
+            bucket.append(log_entry)
+
+    return results_by_func, response.get("errors", [])
+
+
+def iter_field_names(value):
+    """
+    Recursively yield the lowercase dict keys and string-value words found
+    in value.
+    """
+    if isinstance(value, dict):
+        for key, child in value.items():
+            yield str(key).lower()
+            yield from iter_field_names(child)
+    elif isinstance(value, list):
+        for child in value:
+            yield from iter_field_names(child)
+    elif isinstance(value, str):
+        # Responses are often logged as one large JSON string, so the whole
+        # string is tokenized; the regex pass is linear in its length. Words
+        # are yielded one at a time so an early exit skips the rest
+        for match in WORD_PATTERN.finditer(value.lower()):
+            yield match.group()
+
+
+def check_fields_in_response(log_entry: dict, expected_fields: tuple[str, ...],
+                             expected_fields_lc: tuple[str, ...]) -> dict:
+    """
+    Check if expected fields appear anywhere in the log entry, as part of a
+    key or of a word inside a string value (case-insensitive), so that e.g.
+    "address" matches "deliveryAddress".
+    expected_fields_lc holds the lowercased expected_fields, in order.
     Returns a dict with field -> found status.
     """
-    # Convert log entry to string for simple field search
-    log_str = json.dumps(log_entry).lower()
+    # Stop walking the entry as soon as every field has been seen
+    remaining = set(expected_fields_lc)
+    for name in iter_field_names(log_entry):
+        remaining.difference_update([field for field in remaining if field in name])
+        if not remaining:
+            break
 
     results = {}
-    for field in expected_fields:
-        # Check if field name appears in the log (case-insensitive)
-        results[field] = field.lower() in log_str
+    for field, field_lc in zip(expected_fields, expected_fields_lc):
+        results[field] = field_lc not in remaining
 
     return results
 
 
+def truncated_dumps(obj, limit: int = 2000) -> str:
+    """
+    Pretty-print obj as JSON, stopping once limit characters are produced
+    instead of formatting the whole object and slicing it.
+    """
+    parts = []
+    length = 0
+    for chunk in json.JSONEncoder(indent=2).iterencode(obj):
+        parts.append(chunk)
+        length += len(chunk)
+        if length >= limit:
+            break
+    return ''.join(parts)[:limit]
+
+
+def response_body_candidates(attrs: dict):
+    """
+    Yield, in order of preference, the common paths where response data
+    might be stored. Lazy, so later paths are only looked up if needed.
+    """
+    nested = attrs.get("attributes")
+    if isinstance(nested, dict):
+        yield nested.get("response_body")
+        yield nested.get("response")
+        yield nested.get("body")
+    yield attrs.get("message")
+    yield nested
+
+
 def extract_response_body(log_entry: dict) -> str:
     """
     Try to extract the response body or relevant content from log entry.
     """
     attrs = log_entry.get("attributes", {})
 
-    # Try common paths where response data might be stored
-    possible_paths = [
-        attrs.get("attributes", {}).get("response_body"),
-        attrs.get("attributes", {}).get("response"),
-        attrs.get("attributes", {}).get("body"),
-        attrs.get("message"),
-        attrs.get("attributes", {})
-    ]
-
-    for path in possible_paths:
+    for path in response_body_candidates(attrs):
         if path and isinstance(path, (dict, str)):
             if isinstance(path, dict):
-                return json.dumps(path, indent=2)[:2000]
+                return truncated_dumps(path)
             return str(path)[:2000]
 
-    return json.dumps(attrs, indent=2)[:2000]
+    return truncated_dumps(attrs)
 
 
 def main():
-    print("=" * 70)
-    print("DataDog Log Verification for gRPC API Functions")
-    print("Searching env:prod for 'handled request for <function_name>'")
-    print("=" * 70)
-    print()
+    global cache_enabled
+
+    parser = argparse.ArgumentParser(
+        description="Verify DataDog has logs for the gRPC API functions"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always query DataDog instead of reusing cached responses"
+    )
+    args = parser.parse_args()
+    cache_enabled = not args.no_cache
+
+    api_key, app_key = load_credentials()
+    headers = build_search_headers(api_key, app_key)
+
+    # Only needed once the credentials check above has passed
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import datetime, timedelta
+
+    # Output is collected per section and written in one go, instead of a
+    # stdout write (and lock acquisition) for every line
+    buf = io.StringIO()
+
+    def emit(line: str = "") -> None:
+        buf.write(line)
+        buf.write("\n")
+
+    def flush_output() -> None:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+        buf.seek(0)
+        buf.truncate()
+
+    emit("=" * 70)
+    emit("DataDog Log Verification for gRPC API Functions")
+    emit("Searching env:prod for 'handled request for <function_name>'")
+    emit("=" * 70)
+    emit()
 
     results_summary = []
 
+    # One OR query covers every function. The page limit is shared, so busy
+    # functions can crowd out quieter ones; re-query every function that got
+    # fewer than the requested logs individually (concurrently, since it is
+    # pure network I/O) and print the results sequentially afterwards to
+    # keep the output readable
+    emit(f"Searching DataDog for {len(API_FUNCTIONS)} functions...")
+    flush_output()
+    # Every search covers the same window: the last 7 days
+    now = datetime.utcnow()
+    from_str = (now - timedelta(days=7)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    to_str = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    function_names = [api.name for api in API_FUNCTIONS]
+    logs_per_function = 3
+    results_by_func, batch_errors = search_logs_batch(
+        function_names, headers, from_str, to_str, per_func_limit=logs_per_function
+    )
+    for line in batch_errors:
+        emit(f"  {line}")
+
+    short = [
+        name for name, logs in results_by_func.items() if len(logs) < logs_per_function
+    ]
+    errors_by_func = {}
+    if short:
+        with ThreadPoolExecutor(max_workers=len(short)) as executor:
+            futures = {
+                name: executor.submit(
+                    search_logs, name, headers, from_str, to_str, logs_per_function
+                )
+                for name in short
+            }
+            for name, future in futures.items():
+                response = future.result()
+                errors_by_func[name] = response.get("errors", [])
+                logs = response.get("data", [])
+                # Keep the batch results if the re-query failed
+                if len(logs) > len(results_by_func[name]):
+                    results_by_func[name] = logs
+
     for api in API_FUNCTIONS:
-        func_name = api["name"]
-        expected_fields = api["expected_fields"]
-        description = api["description"]
+        func_name = api.name
+        expected_fields = api.expected_fields
+        description = api.description
 
-        print(f"\n{'─' * 70}")
-        print(f"FUNCTION: {func_name}")
-        print(f"Purpose: {description}")
-        print(f"Expected fields: {', '.join(expected_fields)}")
-        print(f"{'─' * 70}")
+        emit(f"\n{'─' * 70}")
+        emit(f"FUNCTION: {func_name}")
+        emit(f"Purpose: {description}")
+        emit(f"Expected fields: {', '.join(expected_fields)}")
+        emit(f"{'─' * 70}")
 
-        # Search for logs
-        print(f"\nSearching DataDog...")
-        response = search_logs(func_name, limit=3)
+        for line in errors_by_func.get(func_name, []):
+            emit(f"  {line}")
 
-        logs = response.get("data", [])
+        logs = results_by_func[func_name]
         log_count = len(logs)
 
         if log_count == 0:
-            print(f"  ❌ NO LOGS FOUND for '{func_name}'")
+            emit(f"  ❌ NO LOGS FOUND for '{func_name}'")
             results_summary.append({
                 "function": func_name,
                 "logs_found": 0,
                 "fields_found": [],
                 "status": "NO_LOGS"
             })
+            flush_output()
             continue
 
-        print(f"  ✅ Found {log_count} log(s)")
+        emit(f"  ✅ Found {log_count} log(s)")
 
         # Analyze the first log entry
         first_log = logs[0]
-        field_results = check_fields_in_response(first_log, expected_fields)
+        field_results = check_fields_in_response(
+            first_log, expected_fields, api.expected_fields_lc
+        )
 
         found_fields = [f for f, found in field_results.items() if found]
         missing_fields = [f for f, found in field_results.items() if not found]
 
-        print(f"\n  Field Analysis (first log entry):")
+        emit(f"\n  Field Analysis (first log entry):")
         for field, found in field_results.items():
             status = "✅" if found else "❌"
-            print(f"    {status} {field}")
+            emit(f"    {status} {field}")
 
         # Show sample response content
-        print(f"\n  Sample log content (truncated):")
+        emit(f"\n  Sample log content (truncated):")
         sample = extract_response_body(first_log)
         # Indent the sample
         for line in sample.split('\n')[:30]:
-            print(f"    {line}")
+            emit(f"    {line}")
         if len(sample.split('\n')) > 30:
-            print(f"    ... (truncated)")
+            emit(f"    ... (truncated)")
 
         results_summary.append({
             "function": func_name,
@@ -230,15 +652,16 @@ def main():
             "fields_missing": missing_fields,
             "status": "FOUND" if found_fields else "NO_EXPECTED_FIELDS"
         })
+        flush_output()
 
     # Print summary
-    print("\n")
-    print("=" * 70)
-    print("SUMMARY")
-    print("=" * 70)
-    print()
-    print(f"{'Function':<30} {'Logs':<8} {'Fields Found':<30} {'Status'}")
-    print("-" * 70)
+    emit("\n")
+    emit("=" * 70)
+    emit("SUMMARY")
+    emit("=" * 70)
+    emit()
+    emit(f"{'Function':<30} {'Logs':<8} {'Fields Found':<30} {'Status'}")
+    emit("-" * 70)
 
     for result in results_summary:
         func = result["function"]
@@ -247,25 +670,26 @@ def main():
         status = result["status"]
 
         status_icon = "✅" if status == "FOUND" else "❌"
-        print(f"{func:<30} {logs:<8} {fields:<30} {status_icon} {status}")
+        emit(f"{func:<30} {logs:<8} {fields:<30} {status_icon} {status}")
 
-    print()
-    print("=" * 70)
-    print("CONCLUSION")
-    print("=" * 70)
+    emit()
+    emit("=" * 70)
+    emit("CONCLUSION")
+    emit("=" * 70)
 
     found_count = sum(1 for r in results_summary if r["status"] == "FOUND")
     total = len(results_summary)
 
     if found_count == total:
-        print(f"✅ All {total} API functions have logs with expected data")
+        emit(f"✅ All {total} API functions have logs with expected data")
     elif found_count > 0:
-        print(f"⚠️  {found_count}/{total} API functions have logs with expected data")
-        print(f"   Missing: {', '.join(r['function'] for r in results_summary if r['status'] != 'FOUND')}")
+        emit(f"⚠️  {found_count}/{total} API functions have logs with expected data")
+        emit(f"   Missing: {', '.join(r['function'] for r in results_summary if r['status'] != 'FOUND')}")
     else:
-        print(f"❌ No API functions found with expected data in logs")
+        emit(f"❌ No API functions found with expected data in logs")
 
-    print()
+    emit()
+    flush_output()
 
 
 if __name__ == "__main__":